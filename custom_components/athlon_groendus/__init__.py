@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+import hashlib
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
@@ -19,12 +29,16 @@ from .const import (
 )
 from .api import AthlonGroendusClient
 from .coordinator import AthlonGroendusCoordinator
+from .storage import TokenStore
 
 PLATFORMS: list[str] = ["sensor"]
 
 SERVICE_IMPORT_HISTORY = "import_history"
 ATTR_ENTRY_ID = "entry_id"
 
+# hass.data[DOMAIN] key holding the API clients shared between config entries.
+DATA_CLIENTS = "clients"
+
 SERVICE_IMPORT_HISTORY_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
 
 
@@ -34,6 +48,97 @@ def _setting(entry: ConfigEntry, key: str, default: str) -> str:
     return default if value in (None, "") else str(value)
 
 
+def _create_session(update_interval_seconds: int) -> aiohttp.ClientSession:
+    """Create an HTTP session whose idle connections survive between polls."""
+    # Home Assistant's shared session drops idle connections after aiohttp's
+    # default 15s, so every poll would pay a new TCP + TLS handshake. Keep the
+    # connection open a little longer than the poll interval instead.
+    connector = aiohttp.TCPConnector(
+        limit=4,
+        keepalive_timeout=max(update_interval_seconds + 30, 330),
+        ttl_dns_cache=600,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def _account_id(entry: ConfigEntry) -> str:
+    """Identify the entry's portal account, e.g. for its stored refresh token."""
+    portal_url = _setting(entry, CONF_PORTAL_URL, DEFAULT_PORTAL_URL)
+    # Hashed so the storage file name does not carry the email address.
+    return hashlib.sha256(f"{entry.data['email']}|{portal_url}".encode()).hexdigest()[:16]
+
+
+@dataclass
+class _SharedClient:
+    """An API client and the number of config entries using it."""
+
+    client: AthlonGroendusClient
+    users: int = 0
+    unsub_close: CALLBACK_TYPE | None = None
+
+
+async def _async_acquire_client(
+    hass: HomeAssistant, entry: ConfigEntry, update_interval_seconds: int
+) -> AthlonGroendusClient:
+    """Return the client for the entry's account, creating it for the first entry.
+
+    Every chargepoint on an account gets its own config entry. Sharing the
+    client means they also share one Cognito login and one connection pool.
+    """
+    clients: dict[tuple[str, ...], _SharedClient] = hass.data[DOMAIN].setdefault(DATA_CLIENTS, {})
+    portal_url = _setting(entry, CONF_PORTAL_URL, DEFAULT_PORTAL_URL)
+    label = _setting(entry, CONF_LABEL, DEFAULT_LABEL)
+    key = (entry.data["email"], entry.data["password"], portal_url, label)
+
+    if key not in clients:
+        token_store = TokenStore(hass, _account_id(entry))
+        refresh_token = await token_store.async_load()
+        # Another entry of the same account may have got here while we loaded.
+        if key not in clients:
+            created = _SharedClient(
+                AthlonGroendusClient(
+                    _create_session(update_interval_seconds),
+                    email=entry.data["email"],
+                    password=entry.data["password"],
+                    portal_url=portal_url,
+                    label=label,
+                    refresh_token=refresh_token,
+                    on_refresh_token=token_store.async_save,
+                )
+            )
+
+            # Config entries are not unloaded when Home Assistant stops, so
+            # close the session here too, like async_create_clientsession does.
+            async def _async_close(_event: Event) -> None:
+                created.unsub_close = None
+                if clients.get(key) is created:
+                    del clients[key]
+                await created.client.aclose()
+
+            created.unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+            clients[key] = created
+
+    shared = clients[key]
+    shared.users += 1
+    return shared.client
+
+
+async def _release_client(hass: HomeAssistant, client: AthlonGroendusClient) -> None:
+    """Drop one entry's hold on a shared client, closing it after the last one."""
+    # Looked up by identity: the entry's options may have changed since setup.
+    clients: dict[tuple[str, ...], _SharedClient] = hass.data[DOMAIN].get(DATA_CLIENTS, {})
+    for key, shared in list(clients.items()):
+        if shared.client is client:
+            shared.users -= 1
+            if shared.users <= 0:
+                del clients[key]
+                if shared.unsub_close is not None:
+                    shared.unsub_close()
+                    shared.unsub_close = None
+                await client.aclose()
+            return
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Athlon Groendus integration (YAML not supported)."""
     hass.data.setdefault(DOMAIN, {})
@@ -45,7 +150,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
         if entry_id:
             coordinator = coordinators.get(entry_id)
-            if coordinator is None:
+            if not hasattr(coordinator, "async_import_history"):
                 raise HomeAssistantError(f"No loaded Athlon Groendus entry with id {entry_id}")
             targets = {entry_id: coordinator}
         else:
@@ -75,27 +180,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create coordinator and do the first refresh here. If the API is temporarily
     # unavailable we should raise ConfigEntryNotReady before forwarding platforms.
-    session = async_get_clientsession(hass)
-    client = AthlonGroendusClient(
-        session,
-        email=entry.data["email"],
-        password=entry.data["password"],
-        portal_url=_setting(entry, CONF_PORTAL_URL, DEFAULT_PORTAL_URL),
-        label=_setting(entry, CONF_LABEL, DEFAULT_LABEL),
-    )
-
-    coordinator = AthlonGroendusCoordinator(
-        hass,
-        client=client,
-        entry_id=entry.entry_id,
-        chargepoint_id=entry.data["chargepoint_id"],
-        update_interval_seconds=int(entry.options.get("update_interval_seconds", 300)),
-        max_pages=int(entry.options.get("max_pages", 5)),
-    )
+    update_interval_seconds = int(entry.options.get("update_interval_seconds", 300))
+    client = await _async_acquire_client(hass, entry, update_interval_seconds)
 
     try:
+        coordinator = AthlonGroendusCoordinator(
+            hass,
+            client=client,
+            entry_id=entry.entry_id,
+            chargepoint_id=entry.data["chargepoint_id"],
+            update_interval_seconds=update_interval_seconds,
+            max_pages=int(entry.options.get("max_pages", 5)),
+        )
         await coordinator.async_config_entry_first_refresh()
     except Exception as err:  # noqa: BLE001
+        # Drop this entry's hold, or the shared client stays open until shutdown.
+        await _release_client(hass, client)
         raise ConfigEntryNotReady(str(err)) from err
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -117,7 +217,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload an Athlon Groendus config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await coordinator.async_flush()
+            await _release_client(hass, coordinator.client)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the account's refresh token once no other entry uses the account."""
+    account = _account_id(entry)
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if other.entry_id != entry.entry_id and _account_id(other) == account:
+            return
+    await TokenStore(hass, account).async_remove()
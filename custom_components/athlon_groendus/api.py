@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, partial
 import logging
-import json
 import time
-from typing import Any
+from typing import Any, Callable
 
 import aiohttp
-import boto3
-from botocore import UNSIGNED
-from botocore.config import Config as BotoConfig
-from warrant_lite import ForceChangePasswordException, WarrantLite
+from aiohttp import hdrs
+from multidict import CIMultiDict
+import orjson
 
 from .const import (
     APPSYNC_GRAPHQL_URL,
@@ -35,8 +35,31 @@ class AthlonGroendusLabelError(AthlonGroendusAuthError):
 class AthlonGroendusApiError(Exception):
     """API request failed."""
 
+
+class _CognitoError(AthlonGroendusAuthError):
+    """Cognito answered with an error; error_type is its __type, e.g. NotAuthorizedException."""
+
+    def __init__(self, error_type: str, message: str) -> None:
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
 _LOGGER = logging.getLogger(__name__)
 
+# Shared rather than built per request. connect/sock_read keep a slow DNS
+# lookup or a stalled socket from eating the whole GraphQL budget.
+_CONFIG_TIMEOUT = aiohttp.ClientTimeout(total=15)
+_GRAPHQL_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=25)
+_COGNITO_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# Cognito's user pool API is plain JSON over HTTPS. InitiateAuth and
+# RespondToAuthChallenge are public and called unsigned (no AWS credentials).
+_COGNITO_URL = "https://cognito-idp.{region}.amazonaws.com/"
+_COGNITO_CONTENT_TYPE = "application/x-amz-json-1.1"
+_COGNITO_TARGET = "AWSCognitoIdentityProviderService.{action}"
+
+# Pages requested at once by list_transactions_pages; more risks AppSync throttling.
+_MAX_CONCURRENT_PAGES = 3
+
 
 @dataclass
 class Tokens:
@@ -67,65 +90,183 @@ class PortalConfig:
         )
 
 
-QUERY_BOOTSTRAP = """
-query bootstrap {
+# Selections shared by the standalone queries and the combined bootstrap below.
+# Only fields the integration reads are requested: the config flow and the
+# tariff currency need the chargepoints, the sensors and history need these
+# transaction fields.
+_DRIVER_SELECTION = """
   getDriver {
-    id
-    firstName
-    lastName
-    email
-    iban
-    installationState
     chargepoints {
-      id
       chargepointId
-      isPublic
       currentTariff {
-        id
         currency
-        ... on SimpleTariff {
-          energyPrice
-        }
-      }
-      evses {
-        id
-        evseId
-        status
       }
     }
   }
-}
 """
 
-
-QUERY_TRANSACTIONS = """
-query TransactionListPage($page: PageInput, $filter: FilterInput) {
+_TRANSACTIONS_SELECTION = """
   listTransactions(page: $page, filter: $filter) {
     totalCount
-    page {
-      page
-      size
-      sort
-    }
     items {
       id
-      type
       chargepointId
       visualNumber
-      tariff
       startDateTime
       endDateTime
       totalEnergy
       totalCost
       status
-      errorCode
-      invoicePeriod
     }
   }
-}
 """
 
 
+def _compact(query: str) -> str:
+    """Collapse the indentation; AppSync ignores it but it is sent every time."""
+    return " ".join(query.split())
+
+
+QUERY_BOOTSTRAP = _compact("query bootstrap {" + _DRIVER_SELECTION + "}")
+
+QUERY_TRANSACTIONS = _compact(
+    "query TransactionListPage($page: PageInput, $filter: FilterInput) {"
+    + _TRANSACTIONS_SELECTION
+    + "}"
+)
+
+# Driver plus the newest page of sessions in one round trip, for polling.
+QUERY_BOOTSTRAP_WITH_TRANSACTIONS = _compact(
+    "query bootstrapWithTransactions($page: PageInput, $filter: FilterInput) {"
+    + _DRIVER_SELECTION
+    + _TRANSACTIONS_SELECTION
+    + "}"
+)
+
+
+# errorType AppSync reports for an expired or rejected token.
+_AUTH_ERROR_TYPES = frozenset({"UnauthorizedException"})
+
+
+def _is_unauthorized(status: int, errors: list[Any] | None) -> bool:
+    """Return True when AppSync rejected the request because of the token."""
+    if status in (401, 403):
+        return True
+    return any(
+        isinstance(error, dict) and error.get("errorType") in _AUTH_ERROR_TYPES
+        for error in errors or ()
+    )
+
+
+def _encode_query(query: str) -> bytes:
+    """Return the opening of an AppSync payload, up to and including the query."""
+    return b'{"query":' + orjson.dumps(query)
+
+
+# The query text never changes, so it is encoded once here and only the
+# variables are serialized per request.
+_ENCODED_QUERIES: dict[str, bytes] = {
+    query: _encode_query(query)
+    for query in (QUERY_BOOTSTRAP, QUERY_TRANSACTIONS, QUERY_BOOTSTRAP_WITH_TRANSACTIONS)
+}
+
+
+def _graphql_body(query: str, variables: dict[str, Any] | None) -> bytes:
+    """Build the JSON request body for a GraphQL call."""
+    body = _ENCODED_QUERIES.get(query) or _encode_query(query)
+    if variables is not None:
+        body += b',"variables":' + orjson.dumps(variables)
+    return body + b"}"
+
+
+# Newest first, as the portal and every poll use; encoded once.
+_DEFAULT_SORT = {"startDateTime": "DESC"}
+_DEFAULT_SORT_JSON = orjson.dumps(_DEFAULT_SORT).decode()
+
+
+def _transaction_variables(
+    page: int,
+    size: int,
+    sort: dict[str, str] | str | None,
+    filter_: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the $page/$filter variables for listTransactions."""
+    # AppSync schema defines PageInput.sort as AWSJSON -> must be a JSON-encoded string.
+    # The portal uses: {"startDateTime":"DESC"} (stringified).
+    sort_json: str
+    if sort is None or sort == _DEFAULT_SORT:
+        sort_json = _DEFAULT_SORT_JSON
+    elif isinstance(sort, str):
+        sort_json = sort
+    else:
+        sort_json = orjson.dumps(sort).decode()
+
+    return {
+        "page": {"page": page, "size": size, "sort": sort_json},
+        "filter": filter_,
+    }
+
+
+@cache
+def _srp_class() -> type:
+    """Build the SRP helper on first use.
+
+    warrant_lite pulls in boto3 at import time, which is slow and only needed
+    for a password login; importing it here keeps it out of integration
+    startup and, as this runs on the auth executor, off the event loop.
+    """
+    from warrant_lite import WarrantLite, g_hex, hex_hash, hex_to_long, n_hex
+
+    # SRP group parameters. WarrantLite derives these from the hex constants for
+    # every instance; they never change, so derive them once per process.
+    srp_n = hex_to_long(n_hex)
+    srp_g = hex_to_long(g_hex)
+    srp_k = hex_to_long(hex_hash("00" + n_hex + "0" + g_hex))
+
+    class _CognitoSrp(WarrantLite):
+        """WarrantLite's SRP maths; the Cognito calls themselves go over aiohttp."""
+
+        def __init__(self, *, username: str, password: str, pool_id: str, client_id: str) -> None:
+            # Deliberately not calling WarrantLite.__init__, which recomputes the
+            # group parameters above and builds a boto3 client we do not use. The
+            # ephemeral a/A pair is still generated fresh for every login, as SRP
+            # requires.
+            self.username = username
+            self.password = password
+            self.pool_id = pool_id
+            self.client_id = client_id
+            self.client_secret = None
+            self.client = None
+            self.big_n = srp_n
+            self.g = srp_g
+            self.k = srp_k
+            self.small_a_value = self.generate_random_small_a()
+            self.large_a_value = self.calculate_a()
+            self.user_pool_region = pool_id.split("_")[0]
+
+    return _CognitoSrp
+
+
+def _new_srp(**kwargs: str) -> Any:
+    """Start an SRP exchange (blocking: generates the ephemeral key)."""
+    return _srp_class()(**kwargs)
+
+
+def _tokens_from_result(result: dict[str, Any]) -> Tokens:
+    """Extract the tokens from a Cognito AuthenticationResult."""
+    auth = result.get("AuthenticationResult") or {}
+    id_token = auth.get("IdToken")
+    access_token = auth.get("AccessToken")
+    if not id_token or not access_token:
+        raise AthlonGroendusAuthError("Missing Cognito tokens")
+    return Tokens(
+        id_token=id_token,
+        access_token=access_token,
+        refresh_token=auth.get("RefreshToken"),
+        expires_in=int(auth.get("ExpiresIn", 3600)),
+    )
+
+
 class AthlonGroendusClient:
     """Athlon Groendus AppSync GraphQL client."""
 
@@ -137,16 +278,59 @@ class AthlonGroendusClient:
         *,
         portal_url: str = DEFAULT_PORTAL_URL,
         label: str = DEFAULT_LABEL,
+        refresh_token: str | None = None,
+        on_refresh_token: Callable[[str | None], None] | None = None,
     ) -> None:
         self._session = session
         self._email = email
         self._password = password
         self._portal_url = portal_url if portal_url.endswith("/") else f"{portal_url}/"
         self._label = label
+        self._client_metadata: dict[str, str] = {
+            # Matches the web portal (see getClientMetadata() in the frontend bundle)
+            "client": CLIENT_GROUP,
+            "label": label,
+            "portalUrl": self._portal_url,
+        }
         self._config: PortalConfig | None = None
         self._tokens: Tokens | None = None
+        # AppSync headers, built once; Authorization follows self._tokens.
+        # aiohttp copies them into each request, so sharing them across
+        # concurrent page requests is safe. Accept-Encoding is left to
+        # aiohttp, which already offers gzip/deflate (and br when available)
+        # and decompresses the transaction lists transparently.
+        self._headers: CIMultiDict[str] = CIMultiDict(
+            {
+                hdrs.AUTHORIZATION: "empty",
+                hdrs.ACCEPT: "application/json",
+                hdrs.CONTENT_TYPE: "application/json",
+            }
+        )
         self._token_expires_at: float | None = None
+        # Survives restarts via on_refresh_token, so a restart does not need
+        # a full SRP login.
+        self._refresh_token = refresh_token
+        self._on_refresh_token = on_refresh_token
         self._auth_lock = asyncio.Lock()
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        # The SRP maths runs on a single thread of its own: it is CPU heavy
+        # and would otherwise hold up Home Assistant's shared executor.
+        self._auth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="athlon_srp")
+
+    async def aclose(self) -> None:
+        """Stop the background token refresh and close the HTTP session.
+
+        Only call this on clients that were given a session of their own.
+        """
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self._auth_executor.shutdown(wait=False, cancel_futures=True)
+        await self._session.close()
 
     async def async_get_config(self) -> PortalConfig:
         """Fetch the portal's AWS config, falling back to the bundled defaults."""
@@ -161,7 +345,7 @@ class AthlonGroendusClient:
                 # Referer, which the browser sends automatically for the
                 # frontend's own XHR to /api/config.
                 headers={"Accept": "application/json", "Referer": self._portal_url},
-                timeout=aiohttp.ClientTimeout(total=15),
+                timeout=_CONFIG_TIMEOUT,
             ) as resp:
                 resp.raise_for_status()
                 data = await resp.json(content_type=None)
@@ -180,6 +364,32 @@ class AthlonGroendusClient:
 
         return self._config
 
+    async def _cognito(self, region: str, action: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Call a Cognito user pool API action and return the decoded response."""
+        async with self._session.post(
+            _COGNITO_URL.format(region=region),
+            data=orjson.dumps(payload),
+            headers={
+                "Content-Type": _COGNITO_CONTENT_TYPE,
+                "X-Amz-Target": _COGNITO_TARGET.format(action=action),
+            },
+            timeout=_COGNITO_TIMEOUT,
+        ) as resp:
+            status = resp.status
+            raw = await resp.read()
+
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            data = {}
+        if status != 200:
+            # Errors look like {"__type": "NotAuthorizedException", "message": "..."};
+            # the type is sometimes prefixed with a namespace and '#'.
+            error_type = str(data.get("__type") or f"HTTP {status}").rsplit("#", 1)[-1]
+            message = data.get("message") or data.get("Message") or ""
+            raise _CognitoError(error_type, message)
+        return data
+
     def _token_is_valid(self) -> bool:
         """Return True when we have a token that is not about to expire."""
         if self._tokens is None or self._token_expires_at is None:
@@ -198,83 +408,26 @@ class AthlonGroendusClient:
             await self.authenticate()
 
     async def authenticate(self) -> None:
-        """Authenticate via Cognito SRP and store tokens."""
+        """Authenticate with Cognito and store tokens.
 
-        config = await self.async_get_config()
+        A stored refresh token is tried first: REFRESH_TOKEN_AUTH is a single
+        request with no SRP maths. A full SRP login is the fallback.
+        """
 
-        client_metadata: dict[str, str] = {
-            # Matches the web portal (see getClientMetadata() in the frontend bundle)
-            "client": CLIENT_GROUP,
-            "label": self._label,
-            "portalUrl": self._portal_url,
-        }
-
-        class _WarrantLiteWithClientMetadata(WarrantLite):
-            """WarrantLite variant that forwards ClientMetadata required by Cognito triggers."""
-
-            def __init__(self, *args: Any, client_metadata: dict[str, str] | None = None, **kwargs: Any) -> None:
-                super().__init__(*args, **kwargs)
-                self._client_metadata = client_metadata or {}
-
-            def authenticate_user(self, client: Any = None) -> Any:  # type: ignore[override]
-                boto_client = self.client or client
-                auth_params = self.get_auth_params()
-                response = boto_client.initiate_auth(
-                    AuthFlow="USER_SRP_AUTH",
-                    AuthParameters=auth_params,
-                    ClientId=self.client_id,
-                    ClientMetadata=self._client_metadata,
-                )
-
-                if response["ChallengeName"] == self.PASSWORD_VERIFIER_CHALLENGE:
-                    challenge_response = self.process_challenge(response["ChallengeParameters"])
-                    challenge_response["USERNAME"] = self.username
-                    tokens = boto_client.respond_to_auth_challenge(
-                        ClientId=self.client_id,
-                        ChallengeName=self.PASSWORD_VERIFIER_CHALLENGE,
-                        ChallengeResponses=challenge_response,
-                        ClientMetadata=self._client_metadata,
-                    )
-
-                    if tokens.get("ChallengeName") == self.NEW_PASSWORD_REQUIRED_CHALLENGE:
-                        raise ForceChangePasswordException("Change password before authenticating")
-
-                    return tokens
-
-                raise NotImplementedError(f"The {response['ChallengeName']} challenge is not supported")
-
-        def _do_auth() -> Tokens:
-            client = boto3.client(
-                "cognito-idp",
-                region_name=config.region,
-                # Cognito User Pool auth APIs (InitiateAuth / RespondToAuthChallenge)
-                # are public and must be called unsigned (no AWS credentials required).
-                config=BotoConfig(signature_version=UNSIGNED),
-            )
-            aws = _WarrantLiteWithClientMetadata(
-                username=self._email,
-                password=self._password,
-                pool_id=config.user_pool_id,
-                client_id=config.client_id,
-                client=client,
-                client_metadata=client_metadata,
-            )
-            tokens = aws.authenticate_user()
-            auth = tokens.get("AuthenticationResult") or {}
-            id_token = auth.get("IdToken")
-            access_token = auth.get("AccessToken")
-            if not id_token or not access_token:
-                raise AthlonGroendusAuthError("Missing Cognito tokens")
-            return Tokens(
-                id_token=id_token,
-                access_token=access_token,
-                refresh_token=auth.get("RefreshToken"),
-                expires_in=int(auth.get("ExpiresIn", 3600)),
-            )
+        config = await self.async_get_config()
 
         try:
-            self._tokens = await asyncio.get_running_loop().run_in_executor(None, _do_auth)
-            self._token_expires_at = time.time() + int(self._tokens.expires_in or 3600)
+            tokens = await self._async_refresh_login(config) if self._refresh_token else None
+            if tokens is None:
+                tokens = await self._async_srp_login(config)
+
+            self._tokens = tokens
+            self._headers[hdrs.AUTHORIZATION] = tokens.id_token
+            self._token_expires_at = time.time() + int(tokens.expires_in or 3600)
+            self._schedule_refresh(int(tokens.expires_in or 3600))
+            # REFRESH_TOKEN_AUTH does not hand out a new refresh token.
+            if tokens.refresh_token and tokens.refresh_token != self._refresh_token:
+                self._set_refresh_token(tokens.refresh_token)
         except Exception as err:  # noqa: BLE001 (HA uses broad handling here)
             _LOGGER.exception("Authentication failed (%s): %s", type(err).__name__, err)
             # The PreAuthentication Lambda rejects accounts that belong to a
@@ -287,53 +440,152 @@ class AthlonGroendusClient:
                 ) from err
             raise AthlonGroendusAuthError(str(err)) from err
 
+    def _set_refresh_token(self, refresh_token: str | None) -> None:
+        self._refresh_token = refresh_token
+        if self._on_refresh_token is not None:
+            self._on_refresh_token(refresh_token)
+
+    async def _async_refresh_login(self, config: PortalConfig) -> Tokens | None:
+        """Renew the tokens with the refresh token; None if Cognito rejects it."""
+        try:
+            result = await self._cognito(
+                config.region,
+                "InitiateAuth",
+                {
+                    "AuthFlow": "REFRESH_TOKEN_AUTH",
+                    "ClientId": config.client_id,
+                    "AuthParameters": {"REFRESH_TOKEN": self._refresh_token},
+                    "ClientMetadata": self._client_metadata,
+                },
+            )
+            return _tokens_from_result(result)
+        except AthlonGroendusAuthError as err:
+            # Throttling or a Cognito outage says nothing about the token: keep it.
+            if isinstance(err, _CognitoError) and err.error_type != "NotAuthorizedException":
+                raise
+            # Expired or revoked; forget it so the next login does not retry it.
+            _LOGGER.info("Refresh token rejected (%s); falling back to SRP login", err)
+            self._set_refresh_token(None)
+            return None
+
+    async def _async_srp_login(self, config: PortalConfig) -> Tokens:
+        """Log in with the password via Cognito SRP."""
+        loop = asyncio.get_running_loop()
+        srp = await loop.run_in_executor(
+            self._auth_executor,
+            partial(
+                _new_srp,
+                username=self._email,
+                password=self._password,
+                pool_id=config.user_pool_id,
+                client_id=config.client_id,
+            ),
+        )
+        challenge = await self._cognito(
+            config.region,
+            "InitiateAuth",
+            {
+                "AuthFlow": "USER_SRP_AUTH",
+                "ClientId": config.client_id,
+                "AuthParameters": srp.get_auth_params(),
+                "ClientMetadata": self._client_metadata,
+            },
+        )
+        if challenge.get("ChallengeName") != srp.PASSWORD_VERIFIER_CHALLENGE:
+            raise NotImplementedError(
+                f"The {challenge.get('ChallengeName')} challenge is not supported"
+            )
+
+        challenge_response = await loop.run_in_executor(
+            self._auth_executor, srp.process_challenge, challenge["ChallengeParameters"]
+        )
+        challenge_response["USERNAME"] = srp.username
+        result = await self._cognito(
+            config.region,
+            "RespondToAuthChallenge",
+            {
+                "ChallengeName": srp.PASSWORD_VERIFIER_CHALLENGE,
+                "ClientId": config.client_id,
+                "ChallengeResponses": challenge_response,
+                "ClientMetadata": self._client_metadata,
+            },
+        )
+        if result.get("ChallengeName") == srp.NEW_PASSWORD_REQUIRED_CHALLENGE:
+            from warrant_lite import ForceChangePasswordException  # loaded by _srp_class
+
+            raise ForceChangePasswordException("Change password before authenticating")
+
+        return _tokens_from_result(result)
+
+    def _schedule_refresh(self, expires_in: int) -> None:
+        """Re-authenticate in the background five minutes before the token expires.
+
+        Without this the first poll after expiry waits for the login inline.
+        If the background refresh fails, _ensure_authenticated still logs in
+        again on the next request.
+        """
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        self._refresh_handle = asyncio.get_running_loop().call_later(
+            max(60, expires_in - 300), self._start_background_refresh
+        )
+
+    def _start_background_refresh(self) -> None:
+        self._refresh_handle = None
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        async with self._auth_lock:
+            try:
+                await self.authenticate()
+            except AthlonGroendusAuthError as err:
+                _LOGGER.warning("Background token refresh failed, retrying on next poll: %s", err)
+
     async def _graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         # (Re)authenticate if needed before calling AppSync.
         await self._ensure_authenticated()
         graphql_url = (await self.async_get_config()).graphql_url
 
-        payload: dict[str, Any] = {"query": query}
-        if variables is not None:
-            payload["variables"] = variables
+        body = _graphql_body(query, variables)
 
         # Retry once on auth errors (expired token, etc.)
         for attempt in (1, 2):
-            headers = {
-                "Authorization": self._tokens.id_token if self._tokens else "empty",
-                "Content-Type": "application/json",
-            }
-
-            try:
-                async with self._session.post(
-                    graphql_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as resp:
-                    data = await resp.json()
-            except aiohttp.ClientResponseError as err:
-                # If AppSync returns 401/403, refresh token and retry once.
-                if attempt == 1 and err.status in (401, 403):
-                    _LOGGER.info("AppSync returned %s, refreshing token and retrying", err.status)
+            sent_token = self._headers[hdrs.AUTHORIZATION]
+            async with self._session.post(
+                graphql_url,
+                data=body,
+                headers=self._headers,
+                timeout=_GRAPHQL_TIMEOUT,
+            ) as resp:
+                status = resp.status
+                raw = await resp.read()
+
+            errors: list[Any] | None = None
+            if 200 <= status < 300:
+                data = orjson.loads(raw)
+                errors = data.get("errors")
+                if not errors:
+                    return data.get("data") or {}
+            else:
+                # AppSync usually explains a failure in a GraphQL error body.
+                try:
+                    errors = orjson.loads(raw).get("errors")
+                except (orjson.JSONDecodeError, AttributeError):
+                    errors = None
+
+            if attempt == 1 and _is_unauthorized(status, errors):
+                _LOGGER.info("AppSync returned %s (unauthorized), refreshing token and retrying", status)
+                # Concurrent page requests can all fail on the same expired
+                # token; only the first one has to throw it away.
+                if self._tokens and self._tokens.id_token == sent_token:
                     self._tokens = None
                     self._token_expires_at = None
-                    await self._ensure_authenticated()
-                    continue
-                raise
+                await self._ensure_authenticated()
+                continue
 
-            errors = data.get("errors")
             if errors:
-                # Detect auth-related GraphQL errors and retry once.
-                err_str = str(errors)
-                if attempt == 1 and ("Unauthorized" in err_str or "NotAuthorized" in err_str):
-                    _LOGGER.info("AppSync unauthorized, refreshing token and retrying")
-                    self._tokens = None
-                    self._token_expires_at = None
-                    await self._ensure_authenticated()
-                    continue
-                raise AthlonGroendusApiError(err_str)
-
-            return data.get("data") or {}
+                raise AthlonGroendusApiError(str(errors))
+            raise AthlonGroendusApiError(f"AppSync returned HTTP {status}")
 
         raise AthlonGroendusApiError("GraphQL request failed after retry")
 
@@ -346,24 +598,41 @@ class AthlonGroendusClient:
         *,
         page: int = 1,
         size: int = 50,
-        # AppSync schema defines PageInput.sort as AWSJSON -> must be a JSON-encoded string.
-        # The portal uses: {"startDateTime":"DESC"} (stringified).
         sort: dict[str, str] | str | None = None,
         filter_: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        sort_json: str
-        if sort is None:
-            sort_json = json.dumps({"startDateTime": "DESC"})
-        elif isinstance(sort, str):
-            sort_json = sort
-        else:
-            sort_json = json.dumps(sort)
-
-        variables: dict[str, Any] = {
-            "page": {"page": page, "size": size, "sort": sort_json},
-            "filter": filter_,
-        }
+        variables = _transaction_variables(page, size, sort, filter_)
         data = await self._graphql(QUERY_TRANSACTIONS, variables=variables)
         return data.get("listTransactions") or {}
 
+    async def list_transactions_pages(
+        self,
+        *,
+        pages: range,
+        size: int = 50,
+        sort: dict[str, str] | str | None = None,
+        filter_: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch several transaction pages concurrently, returned in page order."""
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+
+        async def _fetch(page: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.list_transactions(
+                    page=page, size=size, sort=sort, filter_=filter_
+                )
+
+        return list(await asyncio.gather(*(_fetch(page) for page in pages)))
 
+    async def bootstrap(
+        self,
+        *,
+        page: int = 1,
+        size: int = 50,
+        sort: dict[str, str] | str | None = None,
+        filter_: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Fetch the driver and one page of transactions in a single request."""
+        variables = _transaction_variables(page, size, sort, filter_)
+        data = await self._graphql(QUERY_BOOTSTRAP_WITH_TRANSACTIONS, variables=variables)
+        return data.get("getDriver") or {}, data.get("listTransactions") or {}
@@ -5,7 +5,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import AthlonGroendusAuthError, AthlonGroendusClient, AthlonGroendusLabelError
 from .const import (
@@ -34,12 +34,16 @@ def _normalize_portal_url(portal_url: str) -> str:
 async def _validate_credentials(
     hass: HomeAssistant, email: str, password: str, portal_url: str, label: str
 ) -> dict:
-    session = async_get_clientsession(hass)
+    # A throwaway session rather than the shared one, because aclose() closes
+    # it along with the background token refresh the login schedules.
+    session = async_create_clientsession(hass, auto_cleanup=False)
     client = AthlonGroendusClient(
         session, email=email, password=password, portal_url=portal_url, label=label
     )
-    driver = await client.get_driver_and_chargepoints()
-    return driver
+    try:
+        return await client.get_driver_and_chargepoints()
+    finally:
+        await client.aclose()
 
 
 class AthlonGroendusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -40,6 +40,8 @@ APPSYNC_GRAPHQL_URL = "https://kylqo4g6gres3lmw4rtqaoftke.appsync-api.eu-central
 
 STORE_VERSION = 1
 STORE_KEY_FMT = f"{DOMAIN}.{{entry_id}}"
+# Per account rather than per entry: entries of one account share a login.
+TOKEN_STORE_KEY_FMT = f"{DOMAIN}.auth.{{account}}"
 
 
 def derive_label(portal_url: str) -> str:
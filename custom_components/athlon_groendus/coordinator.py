@@ -1,53 +1,38 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from datetime import timedelta
+import hashlib
 import logging
+import sys
 from typing import Any
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import AthlonGroendusClient
-from .const import DEFAULT_MAX_PAGES, DEFAULT_UPDATE_INTERVAL_SECONDS, STORE_KEY_FMT, STORE_VERSION
+from .const import DEFAULT_MAX_PAGES, DEFAULT_UPDATE_INTERVAL_SECONDS
+from .history import as_float
 from .statistics import async_import_history
+from .storage import EnergyAccumulatorState, EntryStore
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
-class EnergyAccumulatorState:
-    """Persistent state to keep a monotonic total energy."""
 
-    total_energy_kwh: float = 0.0
-    seen_transaction_ids: list[str] = field(default_factory=list)
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "EnergyAccumulatorState":
-        return cls(
-            total_energy_kwh=float(data.get("total_energy_kwh") or 0.0),
-            seen_transaction_ids=list(data.get("seen_transaction_ids") or []),
-        )
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "total_energy_kwh": self.total_energy_kwh,
-            "seen_transaction_ids": self.seen_transaction_ids,
-        }
+def _page_digest(items: list[dict[str, Any]]) -> bytes:
+    """Fingerprint a page of transactions by their ids, in order."""
+    return hashlib.blake2b(
+        b"\0".join(str(tx.get("id") or "").encode() for tx in items), digest_size=16
+    ).digest()
 
 
-class EntryStore:
-    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
-        self._store = Store(hass, STORE_VERSION, STORE_KEY_FMT.format(entry_id=entry_id))
-
-    async def async_load(self) -> EnergyAccumulatorState:
-        data = await self._store.async_load()
-        if not data:
-            return EnergyAccumulatorState()
-        return EnergyAccumulatorState.from_dict(data)
-
-    async def async_save(self, state: EnergyAccumulatorState) -> None:
-        await self._store.async_save(state.to_dict())
+def _top_fingerprint(items: list[dict[str, Any]]) -> tuple[Any, ...] | None:
+    """Identify the newest session, including the fields that change as it ends."""
+    if not items:
+        return None
+    tx = items[0]
+    return tuple(
+        tx.get(key) for key in ("id", "endDateTime", "totalEnergy", "totalCost", "status")
+    )
 
 
 class AthlonGroendusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -66,15 +51,34 @@ class AthlonGroendusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=_LOGGER,
             name="athlon_groendus",
             update_interval=timedelta(seconds=update_interval_seconds),
+            # Most polls return exactly the previous data; skip those state writes.
+            always_update=False,
         )
         self._client = client
         self._entry_id = entry_id
-        self._chargepoint_id = chargepoint_id
+        # Compared against every fetched session on every poll.
+        self._chargepoint_id = sys.intern(str(chargepoint_id))
         self._max_pages = max_pages
         self._store = EntryStore(hass, entry_id)
         self._acc_state: EnergyAccumulatorState | None = None
         self._stats_imported = False
         self._last_driver: dict[str, Any] = {}
+        # Pages 2..N from the last poll, keyed by the page size, the page
+        # budget and a digest of page 1. Sessions are sorted newest first, so
+        # an unchanged page 1 means nothing further down can have changed.
+        self._first_page_key: tuple[int, int, bytes] | None = None
+        self._older_txs: list[dict[str, Any]] = []
+        # Newest session of the last full poll, for the cheap size=1 probe.
+        self._top: tuple[Any, ...] | None = None
+
+    @property
+    def client(self) -> AthlonGroendusClient:
+        return self._client
+
+    async def async_flush(self) -> None:
+        """Write a pending accumulator save, e.g. before the entry unloads."""
+        if self._acc_state is not None:
+            await self._store.async_flush(self._acc_state)
 
     @property
     def accumulator(self) -> EnergyAccumulatorState:
@@ -121,47 +125,113 @@ class AthlonGroendusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if self._acc_state is None:
                 self._acc_state = await self._store.async_load()
 
-            driver = await self._client.get_driver_and_chargepoints()
-
-            # Fetch newest sessions first, accumulate only unseen transaction ids.
-            new_txs: list[dict[str, Any]] = []
-            seen = set(self._acc_state.seen_transaction_ids)
-            fetched_txs: list[dict[str, Any]] = []
+            # Once ids have been seen a poll rarely brings more than one new
+            # session, so a short page does; the full size is for the backfill.
+            size = 10 if self._acc_state.seen_transaction_ids else 50
+            # max_pages is counted in pages of 50. Keep that many sessions in
+            # reach with the short pages too, so a catch-up after downtime
+            # still finds the newest seen id instead of dropping sessions.
+            max_pages = self._max_pages * 50 // size
+            sort = {"startDateTime": "DESC"}
+
+            # With a single chargepoint sessions never overlap, so if the newest
+            # session is unchanged nothing older can have changed either. On
+            # accounts with more chargepoints an older session may still end
+            # underneath a newer one, so those always take the full path.
+            chargepoints = self._last_driver.get("chargepoints") or []
+            if self.data is not None and self._top is not None and len(chargepoints) == 1:
+                probe = await self._client.list_transactions(page=1, size=1, sort=sort)
+                if _top_fingerprint(probe.get("items") or []) == self._top:
+                    await self._async_maybe_import_history(False)
+                    return self.data
+
+            # The driver and the newest page of sessions come back in one request.
+            driver, result = await self._client.bootstrap(page=1, size=size, sort=sort)
+
+            top = _top_fingerprint(result.get("items") or [])
+            first_page_key = (size, max_pages, _page_digest(result.get("items") or []))
+            # Page 1 only vouches for the pages below it when sessions cannot
+            # overlap. With more chargepoints a session further down may have
+            # ended meanwhile, so those pages are fetched again.
+            reuse_older = (
+                first_page_key == self._first_page_key
+                and len(driver.get("chargepoints") or []) == 1
+            )
 
-            for page in range(1, self._max_pages + 1):
-                result = await self._client.list_transactions(page=page, size=50, sort={"startDateTime": "DESC"})
+            # Fetch newest sessions first, accumulate only unseen transaction
+            # ids. One pass over the items also collects the latest sessions.
+            added_energy = 0.0
+            new_ids: list[str] = []
+            latest_sessions: list[dict[str, Any]] = []
+            older_txs: list[dict[str, Any]] = []
+            older_results: list[dict[str, Any]] = []
+            stop = False
+            # Bound once; the item loop below runs for every fetched session.
+            chargepoint_id = self._chargepoint_id
+            is_seen = self._acc_state.is_seen
+            add_new_id = new_ids.append
+
+            for page in range(1, max_pages + 1):
+                if page == 2:
+                    if reuse_older:
+                        # Already processed last poll, so the seen check stops
+                        # on them; they are only needed for latest_sessions.
+                        older_results = [{"items": self._older_txs}]
+                    else:
+                        # Usually the seen session is on page 2 already, so it
+                        # is fetched on its own before committing to the rest.
+                        total = int(result.get("totalCount") or 0)
+                        last_page = min(max_pages, -(-total // size)) if total else max_pages
+                        if last_page < 2:
+                            break
+                        older_results = [
+                            await self._client.list_transactions(page=2, size=size, sort=sort)
+                        ]
+                elif page == 3 and not reuse_older and last_page >= 3:
+                    # Pages 1 and 2 held nothing we had seen: the remaining
+                    # pages are all needed, so fetch them together.
+                    older_results += await self._client.list_transactions_pages(
+                        pages=range(3, last_page + 1), size=size, sort=sort
+                    )
+                if page > 1:
+                    if page - 2 >= len(older_results):
+                        break
+                    result = older_results[page - 2]
                 items = result.get("items") or []
                 if not items:
                     break
 
-                fetched_txs.extend(items)
-                stop = False
+                if page > 1 and not reuse_older:
+                    older_txs.extend(items)
                 for tx in items:
+                    get = tx.get
                     # Only count sessions for selected chargepoint and that are completed (have endDateTime)
-                    if tx.get("chargepointId") != self._chargepoint_id:
+                    if get("chargepointId") != chargepoint_id or not get("endDateTime"):
                         continue
-                    if not tx.get("endDateTime"):
+                    # Provide some latest sessions for attributes (most recent first),
+                    # so "last session" works even when no new sessions appear.
+                    if len(latest_sessions) < 10:
+                        latest_sessions.append(tx)
+                    elif stop:
+                        break
+                    if stop:
                         continue
-                    tx_id = str(tx.get("id") or "")
+                    # Interned so set lookups against loaded ids compare by identity.
+                    tx_id = sys.intern(str(get("id") or ""))
                     if not tx_id:
                         continue
-                    if tx_id in seen:
+                    if is_seen(tx_id):
+                        # Sorted newest first: everything after this was seen too.
                         stop = True
                         continue
-                    new_txs.append(tx)
+                    add_new_id(tx_id)
+                    added_energy += as_float(get("totalEnergy"))
 
                 # If we hit an already-seen transaction in this page, older pages will be seen too.
                 if stop:
                     break
 
             # Update monotonic total
-            added_energy = 0.0
-            for tx in new_txs:
-                try:
-                    added_energy += float(tx.get("totalEnergy") or 0.0)
-                except (TypeError, ValueError):
-                    continue
-
             if added_energy:
                 new_total = float(self._acc_state.total_energy_kwh) + added_energy
                 # Never decrease a TOTAL_INCREASING sensor (Energy Dashboard requirement)
@@ -174,37 +244,31 @@ class AthlonGroendusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 else:
                     self._acc_state.total_energy_kwh = new_total
 
-            # Track ids (keep last 500 to avoid unbounded growth)
-            if new_txs:
-                for tx in new_txs:
-                    tx_id = str(tx.get("id") or "")
-                    if tx_id:
-                        self._acc_state.seen_transaction_ids.insert(0, tx_id)
-                self._acc_state.seen_transaction_ids = self._acc_state.seen_transaction_ids[:500]
-                await self._store.async_save(self._acc_state)
-
-            # Provide some latest sessions for attributes (most recent first).
-            # Use fetched transactions so "last session" works even when no new sessions appear.
-            latest_sessions = sorted(
-                [
-                    tx
-                    for tx in fetched_txs
-                    if tx.get("chargepointId") == self._chargepoint_id and tx.get("endDateTime")
-                ],
-                key=lambda t: t.get("startDateTime") or "",
-                reverse=True,
-            )
+            # Track ids (the accumulator keeps the last 500)
+            if new_ids:
+                # new_ids is newest first; add oldest first so eviction order holds.
+                for tx_id in reversed(new_ids):
+                    self._acc_state.mark_seen(tx_id)
+                self._store.async_save(self._acc_state)
+
+            # Only remember the pages once the whole poll went through, so a
+            # failed page is fetched again next time.
+            if not reuse_older:
+                self._first_page_key = first_page_key
+                self._older_txs = older_txs
+            self._top = top
 
             # Kept separately because self.data is only assigned after this
             # method returns, and the cost statistic needs the tariff currency.
             self._last_driver = driver
-            await self._async_maybe_import_history(bool(new_txs))
+            await self._async_maybe_import_history(bool(new_ids))
 
             return {
                 "driver": driver,
                 "chargepoint_id": self._chargepoint_id,
                 "total_energy_kwh": self._acc_state.total_energy_kwh,
-                "latest_sessions": latest_sessions[:10],
+                "latest_sessions": latest_sessions,
+                "last_session": latest_sessions[0] if latest_sessions else None,
             }
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(str(err)) from err
@@ -34,11 +34,18 @@ def parse_iso(value: Any) -> datetime | None:
     return parsed.astimezone(timezone.utc)
 
 
-def _as_float(value: Any) -> float:
+def as_float(value: Any, default: float | None = 0.0) -> float | None:
+    """Read a portal number; missing counts as 0, unparsable gives the default."""
+    # AppSync sends JSON numbers, so the exact type checks are the usual path;
+    # bools (an int subclass) fall through to float() below.
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
     try:
         return float(value or 0.0)
     except (TypeError, ValueError):
-        return 0.0
+        return default
 
 
 def floor_hour(moment: datetime) -> datetime:
@@ -88,9 +95,9 @@ def build_hourly_totals(
         if end is None:
             continue
 
-        for hour, amount in spread_over_hours(start, end, _as_float(tx.get("totalEnergy"))).items():
+        for hour, amount in spread_over_hours(start, end, as_float(tx.get("totalEnergy"))).items():
             energy[hour] = energy.get(hour, 0.0) + amount
-        for hour, amount in spread_over_hours(start, end, _as_float(tx.get("totalCost"))).items():
+        for hour, amount in spread_over_hours(start, end, as_float(tx.get("totalCost"))).items():
             cost[hour] = cost.get(hour, 0.0) + amount
 
     return energy, cost
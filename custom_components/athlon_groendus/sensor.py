@@ -19,9 +19,10 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import AthlonGroendusCoordinator
+from .history import as_float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AthlonGroendusEntityDescription:
     key: str
     name: str
@@ -81,8 +82,7 @@ class AthlonGroendusTotalEnergySensor(AthlonGroendusBaseEntity, SensorEntity):
 
 class _LastSessionBase(AthlonGroendusBaseEntity, SensorEntity):
     def _latest(self) -> dict[str, Any] | None:
-        sessions = self.coordinator.data.get("latest_sessions") or []
-        return sessions[0] if sessions else None
+        return self.coordinator.data.get("last_session")
 
 
 class AthlonGroendusLastSessionEnergySensor(_LastSessionBase):
@@ -99,10 +99,7 @@ class AthlonGroendusLastSessionEnergySensor(_LastSessionBase):
         tx = self._latest()
         if not tx:
             return None
-        try:
-            return float(tx.get("totalEnergy") or 0.0)
-        except (TypeError, ValueError):
-            return None
+        return as_float(tx.get("totalEnergy"), default=None)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -130,9 +127,6 @@ class AthlonGroendusLastSessionCostSensor(_LastSessionBase):
         tx = self._latest()
         if not tx:
             return None
-        try:
-            return float(tx.get("totalCost") or 0.0)
-        except (TypeError, ValueError):
-            return None
+        return as_float(tx.get("totalCost"), default=None)
 
 
@@ -0,0 +1,115 @@
+"""Persistent state of the integration, kept in Home Assistant's .storage."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import sys
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import STORE_KEY_FMT, STORE_VERSION, TOKEN_STORE_KEY_FMT
+
+# Transaction ids remembered to avoid counting a session twice.
+_MAX_SEEN_TRANSACTION_IDS = 500
+# Delay for writing the accumulator state after a change.
+_SAVE_DELAY_SECONDS = 30
+
+
+@dataclass
+class EnergyAccumulatorState:
+    """Persistent state to keep a monotonic total energy."""
+
+    total_energy_kwh: float = 0.0
+    # Oldest first; the deque drops the oldest id itself once it is full.
+    # Stored on disk as a newest-first list, as before.
+    seen_transaction_ids: deque[str] = field(
+        default_factory=lambda: deque(maxlen=_MAX_SEEN_TRANSACTION_IDS)
+    )
+    # Mirror of seen_transaction_ids for O(1) membership tests.
+    _seen: set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.seen_transaction_ids.maxlen != _MAX_SEEN_TRANSACTION_IDS:
+            self.seen_transaction_ids = deque(
+                self.seen_transaction_ids, maxlen=_MAX_SEEN_TRANSACTION_IDS
+            )
+        self._seen = set(self.seen_transaction_ids)
+
+    def is_seen(self, tx_id: str) -> bool:
+        return tx_id in self._seen
+
+    def mark_seen(self, tx_id: str) -> None:
+        if tx_id in self._seen:
+            return
+        ids = self.seen_transaction_ids
+        if len(ids) == ids.maxlen:
+            self._seen.discard(ids[0])
+        ids.append(tx_id)
+        self._seen.add(tx_id)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EnergyAccumulatorState":
+        return cls(
+            total_energy_kwh=float(data.get("total_energy_kwh") or 0.0),
+            seen_transaction_ids=deque(
+                dict.fromkeys(
+                    sys.intern(str(tx_id)) for tx_id in reversed(data.get("seen_transaction_ids") or [])
+                ),
+                maxlen=_MAX_SEEN_TRANSACTION_IDS,
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_energy_kwh": self.total_energy_kwh,
+            "seen_transaction_ids": list(reversed(self.seen_transaction_ids)),
+        }
+
+
+class EntryStore:
+    # Store already encodes with orjson (homeassistant.helpers.json) in the
+    # executor and decodes with orjson on load, so no custom codec is needed.
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store(hass, STORE_VERSION, STORE_KEY_FMT.format(entry_id=entry_id))
+
+    async def async_load(self) -> EnergyAccumulatorState:
+        data = await self._store.async_load()
+        if not data:
+            return EnergyAccumulatorState()
+        return EnergyAccumulatorState.from_dict(data)
+
+    @callback
+    def async_save(self, state: EnergyAccumulatorState) -> None:
+        # Coalesces back-to-back polls into one write; the last snapshot wins.
+        # Snapshot now: the write may read data_func in the executor while
+        # the next poll is already changing the state.
+        data = state.to_dict()
+        self._store.async_delay_save(lambda: data, _SAVE_DELAY_SECONDS)
+
+    async def async_flush(self, state: EnergyAccumulatorState) -> None:
+        """Write the state now, replacing any pending delayed save."""
+        await self._store.async_save(state.to_dict())
+
+
+class TokenStore:
+    """Keeps an account's Cognito refresh token across restarts."""
+
+    def __init__(self, hass: HomeAssistant, account: str) -> None:
+        self._store = Store(
+            hass, STORE_VERSION, TOKEN_STORE_KEY_FMT.format(account=account), private=True
+        )
+
+    async def async_load(self) -> str | None:
+        data = await self._store.async_load()
+        return (data or {}).get("refresh_token") or None
+
+    @callback
+    def async_save(self, refresh_token: str | None) -> None:
+        self._store.async_delay_save(lambda: {"refresh_token": refresh_token})
+
+    async def async_remove(self) -> None:
+        """Delete the stored token, e.g. once the account's last entry is removed."""
+        await self._store.async_remove()
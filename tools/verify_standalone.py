@@ -19,16 +19,26 @@ Env:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 from typing import Any
 
 import aiohttp
-import boto3
-from botocore import UNSIGNED
-from botocore.config import Config as BotoConfig
 from dotenv import load_dotenv
-from warrant_lite import WarrantLite
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser works too, just slower
+    import json
+
+    json_loads = json.loads
+    json_dumps = json.dumps
+else:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
 
 # The portal is white-label: the tenant "label" is validated by a Cognito
 # PreAuthentication Lambda. A wrong label fails with
@@ -69,19 +79,18 @@ query TransactionListPage($page: PageInput, $filter: FilterInput) {
 """
 
 
-async def fetch_portal_config(portal_url: str) -> dict[str, Any]:
+async def fetch_portal_config(s: aiohttp.ClientSession, portal_url: str) -> dict[str, Any]:
     """Fetch the AWS config the portal frontend boots with.
 
     The portal's WAF answers 502 without a Referer header.
     """
-    async with aiohttp.ClientSession() as s:
-        async with s.get(
-            f"{portal_url}api/config",
-            headers={"Accept": "application/json", "Referer": portal_url},
-            timeout=15,
-        ) as r:
-            r.raise_for_status()
-            return await r.json(content_type=None)
+    async with s.get(
+        f"{portal_url}api/config",
+        headers={"Accept": "application/json", "Referer": portal_url},
+        timeout=15,
+    ) as r:
+        r.raise_for_status()
+        return await r.json(content_type=None, loads=json_loads)
 
 
 def make_client_metadata(portal_url: str, label: str) -> dict[str, str]:
@@ -89,6 +98,12 @@ def make_client_metadata(portal_url: str, label: str) -> dict[str, str]:
 
 
 def get_id_token(email: str, password: str, cfg: dict[str, Any], metadata: dict[str, str]) -> str:
+    # Imported here: boto3 is slow to import and only needed for the login.
+    import boto3
+    from botocore import UNSIGNED
+    from botocore.config import Config as BotoConfig
+    from warrant_lite import WarrantLite
+
     class _WarrantLiteWithClientMetadata(WarrantLite):
         def authenticate_user(self, client: Any = None) -> Any:  # type: ignore[override]
             boto_client = self.client or client
@@ -127,14 +142,15 @@ def get_id_token(email: str, password: str, cfg: dict[str, Any], metadata: dict[
     return tokens["AuthenticationResult"]["IdToken"]
 
 
-async def gql(url: str, id_token: str, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+async def gql(
+    s: aiohttp.ClientSession, url: str, id_token: str, query: str, variables: dict[str, Any] | None = None
+) -> dict[str, Any]:
     headers = {"Authorization": id_token, "Content-Type": "application/json"}
     payload: dict[str, Any] = {"query": query}
     if variables is not None:
         payload["variables"] = variables
-    async with aiohttp.ClientSession() as s:
-        async with s.post(url, json=payload, headers=headers, timeout=30) as r:
-            return await r.json()
+    async with s.post(url, json=payload, headers=headers, timeout=30) as r:
+        return await r.json(loads=json_loads)
 
 
 async def main() -> None:
@@ -148,45 +164,48 @@ async def main() -> None:
     label = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_LABEL
 
     print(f"Portal: {portal_url} (label={label})")
-    print("Fetching portal config…")
-    cfg = await fetch_portal_config(portal_url)
-    graphql_url = cfg["appSync"]["url"]
-    print(f"  userPoolId: {cfg['cognito']['userPoolId']}")
-    print(f"  clientId:   {cfg['cognito']['clientId']}")
-    print(f"  appSync:    {graphql_url}")
-
-    print("Authenticating with Cognito…")
-    id_token = get_id_token(email, password, cfg, make_client_metadata(portal_url, label))
-    print("Auth OK.")
-
-    print("Fetching driver/chargepoints (bootstrap)…")
-    boot = await gql(graphql_url, id_token, QUERY_BOOTSTRAP)
-    if "errors" in boot:
-        raise SystemExit(f"Bootstrap failed: {boot['errors']}")
-    driver = (boot.get("data") or {}).get("getDriver") or {}
-    cps = driver.get("chargepoints") or []
-    print(f"Driver: {driver.get('firstName')} {driver.get('lastName')} ({driver.get('email')})")
-    print(f"Chargepoints: {len(cps)}")
-    for cp in cps[:5]:
-        print(f" - {cp.get('chargepointId')} (public={cp.get('isPublic')})")
-
-    print("Fetching transactions (no sort)…")
-    txs = await gql(
-        graphql_url, id_token, QUERY_TRANSACTIONS, variables={"page": {"page": 1, "size": 10}, "filter": None}
-    )
-    if "errors" in txs:
-        raise SystemExit(f"Transactions failed: {txs['errors']}")
-    lt = (txs.get("data") or {}).get("listTransactions") or {}
-    items = lt.get("items") or []
-    print(f"Transactions returned: {len(items)} (totalCount={lt.get('totalCount')})")
-    if items:
-        print(f"Newest start: {items[0].get('startDateTime')} (id={items[0].get('id')})")
-        print(f"Oldest start: {items[-1].get('startDateTime')} (id={items[-1].get('id')})")
+    # One session for every request, so the AppSync connection is reused.
+    async with aiohttp.ClientSession(json_serialize=json_dumps) as s:
+        print("Fetching portal config…")
+        cfg = await fetch_portal_config(s, portal_url)
+        graphql_url = cfg["appSync"]["url"]
+        print(f"  userPoolId: {cfg['cognito']['userPoolId']}")
+        print(f"  clientId:   {cfg['cognito']['clientId']}")
+        print(f"  appSync:    {graphql_url}")
+
+        print("Authenticating with Cognito…")
+        # boto3 and the SRP maths block; keep them off the event loop.
+        id_token = await asyncio.to_thread(
+            get_id_token, email, password, cfg, make_client_metadata(portal_url, label)
+        )
+        print("Auth OK.")
+
+        print("Fetching driver/chargepoints (bootstrap)…")
+        boot = await gql(s, graphql_url, id_token, QUERY_BOOTSTRAP)
+        if "errors" in boot:
+            raise SystemExit(f"Bootstrap failed: {boot['errors']}")
+        driver = (boot.get("data") or {}).get("getDriver") or {}
+        cps = driver.get("chargepoints") or []
+        print(f"Driver: {driver.get('firstName')} {driver.get('lastName')} ({driver.get('email')})")
+        print(f"Chargepoints: {len(cps)}")
+        for cp in cps[:5]:
+            print(f" - {cp.get('chargepointId')} (public={cp.get('isPublic')})")
+
+        print("Fetching transactions (no sort)…")
+        txs = await gql(
+            s, graphql_url, id_token, QUERY_TRANSACTIONS, variables={"page": {"page": 1, "size": 10}, "filter": None}
+        )
+        if "errors" in txs:
+            raise SystemExit(f"Transactions failed: {txs['errors']}")
+        lt = (txs.get("data") or {}).get("listTransactions") or {}
+        items = lt.get("items") or []
+        print(f"Transactions returned: {len(items)} (totalCount={lt.get('totalCount')})")
+        if items:
+            print(f"Newest start: {items[0].get('startDateTime')} (id={items[0].get('id')})")
+            print(f"Oldest start: {items[-1].get('startDateTime')} (id={items[-1].get('id')})")
 
     print("OK.")
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())